@@ -15,12 +15,12 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
-from typing import Set, Dict
+from typing import Any, Dict, List, Set, Tuple
 
 from py4j.java_gateway import JavaObject
 
 from pyflink.java_gateway import get_gateway
-from pyflink.util.java_utils import add_jars_to_context_class_loader
+from pyflink.util.java_utils import add_jars_to_context_class_loader, to_jarray
 
 
 class Configuration:
@@ -157,6 +157,30 @@ class Configuration:
         self._j_configuration.setBytes(key, value)
         return self
 
+    def get_all(self, keys_and_types: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Returns the values associated with the given keys.
+
+        Example:
+        ::
+
+            >>> config.get_all([('pipeline.name', 'string'), ('parallelism.default', 'int')])
+
+        :param keys_and_types: The list of (key, type) pairs to read, the type is one of
+                               'string', 'boolean' (or 'bool'), 'int', 'long', 'float' and
+                               'double'.
+        :return: The dict which maps each key to its value, or None if there is no value
+                 associated with the key.
+        """
+        gateway = get_gateway()
+        keys = [key for key, _ in keys_and_types]
+        types = [type_name for _, type_name in keys_and_types]
+        j_values = gateway.jvm.org.apache.flink.python.util.ConfigurationBatch.readAll(
+            self._j_configuration,
+            to_jarray(gateway.jvm.String, keys),
+            to_jarray(gateway.jvm.String, types))
+        return {key: j_values.get(key) for key in keys}
+
     def key_set(self) -> Set[str]:
         """
         Returns the keys of all key/value pairs stored inside this configuration object.
@@ -54,6 +54,24 @@ class ConfigurationTests(PyFlinkTestCase):
         self.assertEqual(float_value, 0.5)
         self.assertEqual(bytearray_value, bytearray([1, 2, 3]))
 
+    def test_get_all(self):
+        conf = Configuration()
+
+        conf.set_string("str", "v1")
+        conf.set_string("bool", "true")
+        conf.set_string("boolean", "false")
+        conf.set_integer("long", 1000)
+        conf.set_float("float", 0.5)
+        values = conf.get_all([("str", "string"), ("bool", "bool"), ("boolean", "boolean"),
+                               ("long", "long"), ("float", "double"), ("missing", "int")])
+
+        self.assertEqual(values, {"str": "v1",
+                                  "bool": True,
+                                  "boolean": False,
+                                  "long": 1000,
+                                  "float": 0.5,
+                                  "missing": None})
+
     def test_key_set(self):
         conf = Configuration()
 
@@ -15,9 +15,14 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import json
+import os
+import pathlib
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
-from pyflink.common import typeinfo, Duration, WatermarkStrategy, ConfigOptions
+from pyflink.common import typeinfo, Duration, WatermarkStrategy, ConfigOptions, \
+    Configuration
 from pyflink.common.serialization import JsonRowDeserializationSchema, \
     JsonRowSerializationSchema, Encoder, SimpleStringSchema
 from pyflink.common.typeinfo import Types
@@ -33,11 +38,66 @@ from pyflink.datastream.tests.test_util import DataStreamTestSinkFunction
 from pyflink.java_gateway import get_gateway
 from pyflink.testing.test_case_utils import PyFlinkTestCase, _load_specific_flink_module_jars, \
     invoke_java_object_method
-from pyflink.util.java_utils import load_java_class, get_field_value, is_instance_of
+from pyflink.util.java_utils import load_java_class, get_field_value, get_field_values, \
+    is_instance_of
+
+
+@lru_cache(maxsize=None)
+def _klass(class_name):
+    return load_java_class(class_name)
+
+
+@lru_cache(maxsize=None)
+def _field(class_name, field_name):
+    field = _klass(class_name).getDeclaredField(field_name)
+    field.setAccessible(True)
+    return field
+
+
+@lru_cache(maxsize=None)
+def _jvm_class(class_name):
+    j_obj = get_gateway().jvm
+    for name in class_name.split('.'):
+        j_obj = getattr(j_obj, name)
+    return j_obj
+
+
+def _clear_reflection_caches():
+    # The cached Class and Field objects are bound to the ClassLoader which loaded them, so they
+    # must be dropped whenever the ContextClassLoader is replaced.
+    _field.cache_clear()
+    _klass.cache_clear()
+
+
+class _lazy(object):
+    """
+    Proxy of a Java class which is only resolved through the gateway on first use.
+    """
+
+    def __init__(self, class_name):
+        self._class_name = class_name
+
+    def __getattr__(self, item):
+        return getattr(_jvm_class(self._class_name), item)
+
+
+_KAFKA_STARTUP_MODE = _lazy('org.apache.flink.streaming.connectors.kafka.config.StartupMode')
+
+
+def _iter_files(root):
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            else:
+                yield entry
 
 
 class ConnectorTestBase(PyFlinkTestCase, ABC):
 
+    _ROW_INT_STR = Types.ROW([Types.INT(), Types.STRING()])
+    _jars_loaded = False
+
     @classmethod
     @abstractmethod
     def _get_jars_relative_path(cls):
@@ -46,23 +106,51 @@ class ConnectorTestBase(PyFlinkTestCase, ABC):
         """
         pass
 
+    @classmethod
+    def setUpClass(cls):
+        super(ConnectorTestBase, cls).setUpClass()
+        if not cls._jars_loaded:
+            # Cache current ContextClassLoader, we will replace it with a temporary URLClassLoader
+            # to load specific connector jars with given module path to do dependency isolation.
+            # And We will change the ClassLoader back to the cached ContextClassLoader after all
+            # the test cases of the class finished.
+            cls._cxt_clz_loader = \
+                get_gateway().jvm.Thread.currentThread().getContextClassLoader()
+            _load_specific_flink_module_jars(cls._get_jars_relative_path())
+            cls._jars_loaded = True
+
+    @classmethod
+    def tearDownClass(cls):
+        # Change the ClassLoader back to the cached ContextClassLoader after all the test cases of
+        # the class finished.
+        if cls._jars_loaded:
+            j_thread = get_gateway().jvm.Thread.currentThread()
+            if not cls._cxt_clz_loader.equals(j_thread.getContextClassLoader()):
+                j_thread.setContextClassLoader(cls._cxt_clz_loader)
+                # The py4j JavaClass handles only hold the fully-qualified class name and are
+                # resolved again on each access, so clearing them is merely housekeeping.
+                _jvm_class.cache_clear()
+            cls._jars_loaded = False
+        super(ConnectorTestBase, cls).tearDownClass()
+
     def setUp(self) -> None:
+        # The environment is created per test case as the test cases add their own
+        # transformations and assert on the resulting execution plan.
         self.env = StreamExecutionEnvironment.get_execution_environment()
-        # Cache current ContextClassLoader, we will replace it with a temporary URLClassLoader to
-        # load specific connector jars with given module path to do dependency isolation. And We
-        # will change the ClassLoader back to the cached ContextClassLoader after the test case
-        # finished.
-        self._cxt_clz_loader = get_gateway().jvm.Thread.currentThread().getContextClassLoader()
-        _load_specific_flink_module_jars(self._get_jars_relative_path())
 
-    def tearDown(self):
-        # Change the ClassLoader back to the cached ContextClassLoader after the test case finished.
-        if self._cxt_clz_loader is not None:
-            get_gateway().jvm.Thread.currentThread().setContextClassLoader(self._cxt_clz_loader)
+    def _get_plan_node_type(self, index):
+        """
+        Return the type of the node at the given position of the execution plan.
+        """
+        # The whole plan is fetched with a single gateway call, which is cheaper than walking
+        # the Java StreamGraph node by node.
+        return json.loads(self.env.get_execution_plan())['nodes'][index]['type']
 
 
 class FlinkKafkaTest(ConnectorTestBase):
 
+    _KAFKA_PROPS = {'bootstrap.servers': 'localhost:9092', 'group.id': 'test_group'}
+
     @classmethod
     def _get_jars_relative_path(cls):
         return '/flink-connectors/flink-sql-connector-kafka'
@@ -77,8 +165,8 @@ class FlinkKafkaTest(ConnectorTestBase):
     def kafka_connector_assertion(self, flink_kafka_consumer_clz, flink_kafka_producer_clz):
         source_topic = 'test_source_topic'
         sink_topic = 'test_sink_topic'
-        props = {'bootstrap.servers': 'localhost:9092', 'group.id': 'test_group'}
-        type_info = Types.ROW([Types.INT(), Types.STRING()])
+        props = self._KAFKA_PROPS
+        type_info = self._ROW_INT_STR
 
         # Test for kafka consumer
         deserialization_schema = JsonRowDeserializationSchema.builder() \
@@ -88,22 +176,22 @@ class FlinkKafkaTest(ConnectorTestBase):
         flink_kafka_consumer.set_start_from_earliest()
         flink_kafka_consumer.set_commit_offsets_on_checkpoints(True)
 
-        j_properties = get_field_value(flink_kafka_consumer.get_java_function(), 'properties')
+        consumer_fields = get_field_values(
+            flink_kafka_consumer.get_java_function(),
+            ['properties', 'enableCommitOnCheckpoints', 'startupMode', 'deserializer',
+             'topicsDescriptor'])
+        j_properties = consumer_fields['properties']
         self.assertEqual('localhost:9092', j_properties.getProperty('bootstrap.servers'))
         self.assertEqual('test_group', j_properties.getProperty('group.id'))
-        self.assertTrue(get_field_value(flink_kafka_consumer.get_java_function(),
-                                        'enableCommitOnCheckpoints'))
-        j_start_up_mode = get_field_value(flink_kafka_consumer.get_java_function(), 'startupMode')
+        self.assertTrue(consumer_fields['enableCommitOnCheckpoints'])
+        j_start_up_mode = consumer_fields['startupMode']
 
-        j_deserializer = get_field_value(flink_kafka_consumer.get_java_function(), 'deserializer')
+        j_deserializer = consumer_fields['deserializer']
         j_deserialize_type_info = invoke_java_object_method(j_deserializer, "getProducedType")
         deserialize_type_info = typeinfo._from_java_type(j_deserialize_type_info)
         self.assertTrue(deserialize_type_info == type_info)
-        self.assertTrue(j_start_up_mode.equals(get_gateway().jvm
-                                               .org.apache.flink.streaming.connectors
-                                               .kafka.config.StartupMode.EARLIEST))
-        j_topic_desc = get_field_value(flink_kafka_consumer.get_java_function(),
-                                       'topicsDescriptor')
+        self.assertTrue(j_start_up_mode.equals(_KAFKA_STARTUP_MODE.EARLIEST))
+        j_topic_desc = consumer_fields['topicsDescriptor']
         j_topics = invoke_java_object_method(j_topic_desc, 'getFixedTopics')
         self.assertEqual(['test_source_topic'], list(j_topics))
 
@@ -113,12 +201,12 @@ class FlinkKafkaTest(ConnectorTestBase):
         flink_kafka_producer = flink_kafka_producer_clz(sink_topic, serialization_schema, props)
         flink_kafka_producer.set_write_timestamp_to_kafka(False)
 
-        j_producer_config = get_field_value(flink_kafka_producer.get_java_function(),
-                                            'producerConfig')
+        producer_fields = get_field_values(
+            flink_kafka_producer.get_java_function(), ['producerConfig', 'writeTimestampToKafka'])
+        j_producer_config = producer_fields['producerConfig']
         self.assertEqual('localhost:9092', j_producer_config.getProperty('bootstrap.servers'))
         self.assertEqual('test_group', j_producer_config.getProperty('group.id'))
-        self.assertFalse(get_field_value(flink_kafka_producer.get_java_function(),
-                                         'writeTimestampToKafka'))
+        self.assertFalse(producer_fields['writeTimestampToKafka'])
 
 
 class FlinkJdbcSinkTest(ConnectorTestBase):
@@ -142,8 +230,7 @@ class FlinkJdbcSinkTest(ConnectorTestBase):
                                   jdbc_execution_options)
 
         ds.add_sink(jdbc_sink).name('jdbc sink')
-        plan = eval(self.env.get_execution_plan())
-        self.assertEqual('Sink: jdbc sink', plan['nodes'][1]['type'])
+        self.assertEqual('Sink: jdbc sink', self._get_plan_node_type(1))
         j_output_format = get_field_value(jdbc_sink.get_java_function(), 'outputFormat')
 
         connection_options = JdbcConnectionOptions(
@@ -171,6 +258,15 @@ class FlinkPulsarTest(ConnectorTestBase):
     def _get_jars_relative_path(cls):
         return '/flink-connectors/flink-sql-connector-pulsar'
 
+    @staticmethod
+    def _base_pulsar_source_builder():
+        return PulsarSource.builder() \
+            .set_service_url('pulsar://localhost:6650') \
+            .set_admin_url('http://localhost:8080') \
+            .set_subscription_name('ff') \
+            .set_deserialization_schema(
+                PulsarDeserializationSchema.flink_schema(SimpleStringSchema()))
+
     def test_pulsar_source(self):
         TEST_OPTION_NAME = 'pulsar.source.enableAutoAcknowledgeMessage'
         pulsar_source = PulsarSource.builder() \
@@ -194,82 +290,48 @@ class FlinkPulsarTest(ConnectorTestBase):
                                   watermark_strategy=WatermarkStrategy.for_monotonous_timestamps(),
                                   source_name="pulsar source")
         ds.print()
-        plan = eval(self.env.get_execution_plan())
-        self.assertEqual('Source: pulsar source', plan['nodes'][0]['type'])
-
-        configuration = get_field_value(pulsar_source.get_java_function(), "sourceConfiguration")
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.client.serviceUrl')
-                .string_type()
-                .no_default_value()._j_config_option), 'pulsar://localhost:6650')
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.admin.adminUrl')
-                .string_type()
-                .no_default_value()._j_config_option), 'http://localhost:8080')
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.consumer.subscriptionName')
-                .string_type()
-                .no_default_value()._j_config_option), 'ff')
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.consumer.subscriptionType')
-                .string_type()
-                .no_default_value()._j_config_option), SubscriptionType.Exclusive.name)
-        test_option = ConfigOptions.key(TEST_OPTION_NAME).boolean_type().no_default_value()
+        self.assertEqual('Source: pulsar source', self._get_plan_node_type(0))
+
+        configuration = Configuration(j_configuration=get_field_value(
+            pulsar_source.get_java_function(), "sourceConfiguration"))
+        values = configuration.get_all([('pulsar.client.serviceUrl', 'string'),
+                                        ('pulsar.admin.adminUrl', 'string'),
+                                        ('pulsar.consumer.subscriptionName', 'string'),
+                                        ('pulsar.consumer.subscriptionType', 'string'),
+                                        (TEST_OPTION_NAME, 'boolean'),
+                                        ('pulsar.source.autoCommitCursorInterval', 'long')])
+        self.assertEqual(values['pulsar.client.serviceUrl'], 'pulsar://localhost:6650')
+        self.assertEqual(values['pulsar.admin.adminUrl'], 'http://localhost:8080')
+        self.assertEqual(values['pulsar.consumer.subscriptionName'], 'ff')
         self.assertEqual(
-            configuration.getBoolean(
-                test_option._j_config_option), True)
-        self.assertEqual(
-            configuration.getLong(
-                ConfigOptions.key('pulsar.source.autoCommitCursorInterval')
-                .long_type()
-                .no_default_value()._j_config_option), 1000)
+            values['pulsar.consumer.subscriptionType'], SubscriptionType.Exclusive.name)
+        self.assertEqual(values[TEST_OPTION_NAME], True)
+        self.assertEqual(values['pulsar.source.autoCommitCursorInterval'], 1000)
 
     def test_source_set_topics_with_list(self):
-        PulsarSource.builder() \
-            .set_service_url('pulsar://localhost:6650') \
-            .set_admin_url('http://localhost:8080') \
+        self._base_pulsar_source_builder() \
             .set_topics(['ada', 'beta']) \
-            .set_subscription_name('ff') \
-            .set_deserialization_schema(
-                PulsarDeserializationSchema.flink_schema(SimpleStringSchema())) \
             .build()
 
     def test_source_set_topics_pattern(self):
-        PulsarSource.builder() \
-            .set_service_url('pulsar://localhost:6650') \
-            .set_admin_url('http://localhost:8080') \
+        self._base_pulsar_source_builder() \
             .set_topics_pattern('ada.*') \
-            .set_subscription_name('ff') \
-            .set_deserialization_schema(
-                PulsarDeserializationSchema.flink_schema(SimpleStringSchema())) \
             .build()
 
     def test_source_deprecated_method(self):
         test_option = ConfigOptions.key('pulsar.source.enableAutoAcknowledgeMessage') \
             .boolean_type().no_default_value()
-        pulsar_source = PulsarSource.builder() \
-            .set_service_url('pulsar://localhost:6650') \
-            .set_admin_url('http://localhost:8080') \
+        pulsar_source = self._base_pulsar_source_builder() \
             .set_topics('ada') \
-            .set_deserialization_schema(
-                PulsarDeserializationSchema.flink_type_info(Types.STRING(), None)) \
-            .set_subscription_name('ff') \
             .set_config(test_option, True) \
             .set_config_with_dict({'pulsar.source.autoCommitCursorInterval': '1000'}) \
             .build()
-        configuration = get_field_value(pulsar_source.get_java_function(), "sourceConfiguration")
-        self.assertEqual(
-            configuration.getBoolean(
-                test_option._j_config_option), True)
-        self.assertEqual(
-            configuration.getLong(
-                ConfigOptions.key('pulsar.source.autoCommitCursorInterval')
-                .long_type()
-                .no_default_value()._j_config_option), 1000)
+        configuration = Configuration(j_configuration=get_field_value(
+            pulsar_source.get_java_function(), "sourceConfiguration"))
+        values = configuration.get_all([('pulsar.source.enableAutoAcknowledgeMessage', 'boolean'),
+                                        ('pulsar.source.autoCommitCursorInterval', 'long')])
+        self.assertEqual(values['pulsar.source.enableAutoAcknowledgeMessage'], True)
+        self.assertEqual(values['pulsar.source.autoCommitCursorInterval'], 1000)
 
     def test_pulsar_sink(self):
         ds = self.env.from_collection([('ab', 1), ('bdc', 2), ('cfgs', 3), ('deeefg', 4)],
@@ -292,27 +354,22 @@ class FlinkPulsarTest(ConnectorTestBase):
 
         ds.sink_to(pulsar_sink).name('pulsar sink')
 
-        plan = eval(self.env.get_execution_plan())
-        self.assertEqual('pulsar sink: Writer', plan['nodes'][1]['type'])
-        configuration = get_field_value(pulsar_sink.get_java_function(), "sinkConfiguration")
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.client.serviceUrl')
-                .string_type()
-                .no_default_value()._j_config_option), 'pulsar://localhost:6650')
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.admin.adminUrl')
-                .string_type()
-                .no_default_value()._j_config_option), 'http://localhost:8080')
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.producer.producerName')
-                .string_type()
-                .no_default_value()._j_config_option), 'fo - %s')
-
-        j_pulsar_serialization_schema = get_field_value(
-            pulsar_sink.get_java_function(), 'serializationSchema')
+        self.assertEqual('pulsar sink: Writer', self._get_plan_node_type(1))
+        sink_fields = get_field_values(
+            pulsar_sink.get_java_function(),
+            ['sinkConfiguration', 'serializationSchema', 'topicRouter', 'messageDelayer'])
+        configuration = Configuration(j_configuration=sink_fields['sinkConfiguration'])
+        values = configuration.get_all([('pulsar.client.serviceUrl', 'string'),
+                                        ('pulsar.admin.adminUrl', 'string'),
+                                        ('pulsar.producer.producerName', 'string'),
+                                        ('pulsar.sink.deliveryGuarantee', 'string'),
+                                        (TEST_OPTION_NAME, 'boolean'),
+                                        ('pulsar.producer.batchingMaxMessages', 'long')])
+        self.assertEqual(values['pulsar.client.serviceUrl'], 'pulsar://localhost:6650')
+        self.assertEqual(values['pulsar.admin.adminUrl'], 'http://localhost:8080')
+        self.assertEqual(values['pulsar.producer.producerName'], 'fo - %s')
+
+        j_pulsar_serialization_schema = sink_fields['serializationSchema']
         j_serialization_schema = get_field_value(
             j_pulsar_serialization_schema, 'serializationSchema')
         self.assertTrue(
@@ -320,31 +377,20 @@ class FlinkPulsarTest(ConnectorTestBase):
                 j_serialization_schema,
                 'org.apache.flink.api.common.serialization.SimpleStringSchema'))
 
-        self.assertEqual(
-            configuration.getString(
-                ConfigOptions.key('pulsar.sink.deliveryGuarantee')
-                .string_type()
-                .no_default_value()._j_config_option), 'at-least-once')
+        self.assertEqual(values['pulsar.sink.deliveryGuarantee'], 'at-least-once')
 
-        j_topic_router = get_field_value(pulsar_sink.get_java_function(), "topicRouter")
+        j_topic_router = sink_fields['topicRouter']
         self.assertTrue(
             is_instance_of(
                 j_topic_router,
                 'org.apache.flink.connector.pulsar.sink.writer.router.RoundRobinTopicRouter'))
 
-        j_message_delayer = get_field_value(pulsar_sink.get_java_function(), 'messageDelayer')
+        j_message_delayer = sink_fields['messageDelayer']
         delay_duration = get_field_value(j_message_delayer, 'delayDuration')
         self.assertEqual(delay_duration, 12000)
 
-        test_option = ConfigOptions.key(TEST_OPTION_NAME).boolean_type().no_default_value()
-        self.assertEqual(
-            configuration.getBoolean(
-                test_option._j_config_option), True)
-        self.assertEqual(
-            configuration.getLong(
-                ConfigOptions.key('pulsar.producer.batchingMaxMessages')
-                .long_type()
-                .no_default_value()._j_config_option), 100)
+        self.assertEqual(values[TEST_OPTION_NAME], True)
+        self.assertEqual(values['pulsar.producer.batchingMaxMessages'], 100)
 
     def test_sink_set_topics_with_list(self):
         PulsarSink.builder() \
@@ -370,7 +416,7 @@ class RMQTest(ConnectorTestBase):
             .set_user_name('guest') \
             .set_password('guest') \
             .build()
-        type_info = Types.ROW([Types.INT(), Types.STRING()])
+        type_info = self._ROW_INT_STR
         deserialization_schema = JsonRowDeserializationSchema.builder() \
             .type_info(type_info=type_info).build()
 
@@ -389,11 +435,24 @@ class RMQTest(ConnectorTestBase):
 
 class ConnectorTests(PyFlinkTestCase):
 
-    def setUp(self) -> None:
-        self.env = StreamExecutionEnvironment.get_execution_environment()
-        self.test_sink = DataStreamTestSinkFunction()
+    @classmethod
+    def setUpClass(cls):
+        super(ConnectorTests, cls).setUpClass()
+        # Cache current ContextClassLoader and change it back after all the test cases of the
+        # class finished, see ConnectorTestBase.
+        cls._cxt_clz_loader = get_gateway().jvm.Thread.currentThread().getContextClassLoader()
         _load_specific_flink_module_jars('/flink-connectors/flink-connector-files')
         _load_specific_flink_module_jars('/flink-connectors/flink-connector-sink-common')
+        cls.test_sink = DataStreamTestSinkFunction()
+
+    @classmethod
+    def tearDownClass(cls):
+        get_gateway().jvm.Thread.currentThread().setContextClassLoader(cls._cxt_clz_loader)
+        _clear_reflection_caches()
+        super(ConnectorTests, cls).tearDownClass()
+
+    def setUp(self) -> None:
+        self.env = StreamExecutionEnvironment.get_execution_environment()
 
     def tearDown(self) -> None:
         self.test_sink.clear()
@@ -419,15 +478,10 @@ class ConnectorTests(PyFlinkTestCase):
         self.env.execute("test_streaming_file_sink")
 
         results = []
-        import os
-        for root, dirs, files in os.walk(self.tempdir, topdown=True):
-            for file in files:
-                self.assertTrue(file.startswith('.prefix'))
-                self.assertTrue('suffix' in file)
-                path = root + "/" + file
-                with open(path) as infile:
-                    for line in infile:
-                        results.append(line)
+        for entry in _iter_files(self.tempdir):
+            self.assertTrue(entry.name.startswith('.prefix'))
+            self.assertTrue('suffix' in entry.name)
+            results.extend(pathlib.Path(entry.path).read_text().splitlines(keepends=True))
 
         expected = ['deeefg\n', 'bdc\n', 'ab\n', 'cfgs\n']
         results.sort()
@@ -449,9 +503,7 @@ class ConnectorTests(PyFlinkTestCase):
         self.assertEqual(Duration.of_days(1), Duration(continuous_setting.getDiscoveryInterval()))
 
         input_paths_field = \
-            load_java_class("org.apache.flink.connector.file.src.AbstractFileSource"). \
-            getDeclaredField("inputPaths")
-        input_paths_field.setAccessible(True)
+            _field("org.apache.flink.connector.file.src.AbstractFileSource", "inputPaths")
         input_paths = input_paths_field.get(file_source.get_java_function())
         self.assertEqual(len(input_paths), len(paths))
         self.assertEqual(str(input_paths[0]), paths[0])
@@ -470,36 +522,29 @@ class ConnectorTests(PyFlinkTestCase):
             .build()
 
         buckets_builder_field = \
-            load_java_class("org.apache.flink.connector.file.sink.FileSink"). \
-            getDeclaredField("bucketsBuilder")
-        buckets_builder_field.setAccessible(True)
+            _field("org.apache.flink.connector.file.sink.FileSink", "bucketsBuilder")
         buckets_builder = buckets_builder_field.get(file_sink.get_java_function())
 
         self.assertEqual("DefaultRowFormatBuilder", buckets_builder.getClass().getSimpleName())
 
-        row_format_builder_clz = load_java_class(
-            "org.apache.flink.connector.file.sink.FileSink$RowFormatBuilder")
-        encoder_field = row_format_builder_clz.getDeclaredField("encoder")
-        encoder_field.setAccessible(True)
+        row_format_builder_class_name = \
+            "org.apache.flink.connector.file.sink.FileSink$RowFormatBuilder"
+        encoder_field = _field(row_format_builder_class_name, "encoder")
         self.assertEqual("SimpleStringEncoder",
                          encoder_field.get(buckets_builder).getClass().getSimpleName())
 
-        interval_field = row_format_builder_clz.getDeclaredField("bucketCheckInterval")
-        interval_field.setAccessible(True)
+        interval_field = _field(row_format_builder_class_name, "bucketCheckInterval")
         self.assertEqual(1000, interval_field.get(buckets_builder))
 
-        bucket_assigner_field = row_format_builder_clz.getDeclaredField("bucketAssigner")
-        bucket_assigner_field.setAccessible(True)
+        bucket_assigner_field = _field(row_format_builder_class_name, "bucketAssigner")
         self.assertEqual("BasePathBucketAssigner",
                          bucket_assigner_field.get(buckets_builder).getClass().getSimpleName())
 
-        rolling_policy_field = row_format_builder_clz.getDeclaredField("rollingPolicy")
-        rolling_policy_field.setAccessible(True)
+        rolling_policy_field = _field(row_format_builder_class_name, "rollingPolicy")
         self.assertEqual("OnCheckpointRollingPolicy",
                          rolling_policy_field.get(buckets_builder).getClass().getSimpleName())
 
-        output_file_config_field = row_format_builder_clz.getDeclaredField("outputFileConfig")
-        output_file_config_field.setAccessible(True)
+        output_file_config_field = _field(row_format_builder_class_name, "outputFileConfig")
         output_file_config = output_file_config_field.get(buckets_builder)
         self.assertEqual("pre", output_file_config.getPartPrefix())
         self.assertEqual("suf", output_file_config.getPartSuffix())
@@ -507,12 +552,9 @@ class ConnectorTests(PyFlinkTestCase):
     def test_seq_source(self):
         seq_source = NumberSequenceSource(1, 10)
 
-        seq_source_clz = load_java_class(
-            "org.apache.flink.api.connector.source.lib.NumberSequenceSource")
-        from_field = seq_source_clz.getDeclaredField("from")
-        from_field.setAccessible(True)
+        seq_source_class_name = "org.apache.flink.api.connector.source.lib.NumberSequenceSource"
+        from_field = _field(seq_source_class_name, "from")
         self.assertEqual(1, from_field.get(seq_source.get_java_function()))
 
-        to_field = seq_source_clz.getDeclaredField("to")
-        to_field.setAccessible(True)
+        to_field = _field(seq_source_class_name, "to")
         self.assertEqual(10, to_field.get(seq_source.get_java_function()))
@@ -97,6 +97,19 @@ def get_field_value(java_obj, field_name):
     return field.get(java_obj)
 
 
+def get_field_values(java_obj, field_names):
+    """
+    Get the values of the given fields of a Java object as a dict keyed by field name.
+
+    :param java_obj: The Java object to read the fields from.
+    :param field_names: The list of field names to read.
+    """
+    gateway = get_gateway()
+    j_values = gateway.jvm.org.apache.flink.python.util.ReflectionBatch.readFields(
+        java_obj, to_jarray(gateway.jvm.String, field_names))
+    return {field_name: j_values.get(field_name) for field_name in field_names}
+
+
 def get_field(cls, field_name):
     try:
         field = cls.getDeclaredField(field_name)
@@ -0,0 +1,76 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.apache.flink.python.util;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.configuration.ConfigOption;
+import org.apache.flink.configuration.ConfigOptions;
+import org.apache.flink.configuration.Configuration;
+
+import java.util.HashMap;
+import java.util.Map;
+
+import static org.apache.flink.util.Preconditions.checkArgument;
+
+/** Reads the values of several keys of a {@link Configuration}, each converted to a given type. */
+@Internal
+public final class ConfigurationBatch {
+
+    private ConfigurationBatch() {}
+
+    /**
+     * Reads the values of the given keys from the configuration. The value of each key is
+     * converted to the type at the same position of the given types, which is one of "string",
+     * "boolean" (or "bool"), "int", "long", "float" and "double". Keys without a value are mapped
+     * to null.
+     */
+    public static Map<String, Object> readAll(
+            Configuration configuration, String[] keys, String[] types) {
+        checkArgument(
+                keys.length == types.length,
+                "The number of keys (%s) and types (%s) must be equal.",
+                keys.length,
+                types.length);
+        final Map<String, Object> values = new HashMap<>(keys.length);
+        for (int i = 0; i < keys.length; i++) {
+            values.put(keys[i], configuration.get(createOption(keys[i], types[i])));
+        }
+        return values;
+    }
+
+    private static ConfigOption<?> createOption(String key, String type) {
+        final ConfigOptions.OptionBuilder builder = ConfigOptions.key(key);
+        switch (type) {
+            case "string":
+                return builder.stringType().noDefaultValue();
+            case "boolean":
+            case "bool":
+                return builder.booleanType().noDefaultValue();
+            case "int":
+                return builder.intType().noDefaultValue();
+            case "long":
+                return builder.longType().noDefaultValue();
+            case "float":
+                return builder.floatType().noDefaultValue();
+            case "double":
+                return builder.doubleType().noDefaultValue();
+            default:
+                throw new IllegalArgumentException(
+                        String.format("Unsupported type '%s' of config option '%s'.", type, key));
+        }
+    }
+}
@@ -0,0 +1,56 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.apache.flink.python.util;
+
+import org.apache.flink.annotation.Internal;
+
+import java.lang.reflect.Field;
+import java.util.HashMap;
+import java.util.Map;
+
+/** Reads the values of private fields of an object, including fields of its superclasses. */
+@Internal
+public final class ReflectionBatch {
+
+    private ReflectionBatch() {}
+
+    /**
+     * Reads the values of the given fields of the target object. The fields are looked up
+     * recursively in the class hierarchy of the target object.
+     */
+    public static Map<String, Object> readFields(Object target, String[] names)
+            throws IllegalAccessException, NoSuchFieldException {
+        final Map<String, Object> values = new HashMap<>(names.length);
+        for (String name : names) {
+            values.put(name, getField(target.getClass(), name).get(target));
+        }
+        return values;
+    }
+
+    private static Field getField(Class<?> clazz, String name) throws NoSuchFieldException {
+        for (Class<?> clz = clazz; clz != null; clz = clz.getSuperclass()) {
+            try {
+                Field field = clz.getDeclaredField(name);
+                field.setAccessible(true);
+                return field;
+            } catch (NoSuchFieldException e) {
+                // ignore
+            }
+        }
+        throw new NoSuchFieldException(String.format("Field '%s' not found.", name));
+    }
+}
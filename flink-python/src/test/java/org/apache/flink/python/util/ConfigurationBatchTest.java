@@ -0,0 +1,67 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.apache.flink.python.util;
+
+import org.apache.flink.configuration.Configuration;
+
+import org.junit.jupiter.api.Test;
+
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+
+/** Tests for {@link ConfigurationBatch}. */
+class ConfigurationBatchTest {
+
+    @Test
+    void testReadAll() {
+        Configuration config = new Configuration();
+        config.setString("str", "v1");
+        config.setString("bool", "true");
+        config.setString("boolean", "false");
+        config.setString("long", "1000");
+        config.setDouble("double", 0.5);
+
+        Map<String, Object> values =
+                ConfigurationBatch.readAll(
+                        config,
+                        new String[] {"str", "bool", "boolean", "long", "double", "missing"},
+                        new String[] {"string", "bool", "boolean", "long", "double", "int"});
+
+        assertThat(values)
+                .hasSize(6)
+                .containsEntry("str", "v1")
+                .containsEntry("bool", true)
+                .containsEntry("boolean", false)
+                .containsEntry("long", 1000L)
+                .containsEntry("double", 0.5)
+                .containsEntry("missing", null);
+    }
+
+    @Test
+    void testReadAllWithUnsupportedType() {
+        assertThatThrownBy(
+                        () ->
+                                ConfigurationBatch.readAll(
+                                        new Configuration(),
+                                        new String[] {"key"},
+                                        new String[] {"map"}))
+                .isInstanceOf(IllegalArgumentException.class)
+                .hasMessageContaining("map");
+    }
+}
@@ -0,0 +1,56 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.apache.flink.python.util;
+
+import org.junit.jupiter.api.Test;
+
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+
+/** Tests for {@link ReflectionBatch}. */
+class ReflectionBatchTest {
+
+    @Test
+    void testReadFields() throws Exception {
+        Map<String, Object> values =
+                ReflectionBatch.readFields(new Child(), new String[] {"name", "count", "enabled"});
+
+        assertThat(values)
+                .hasSize(3)
+                .containsEntry("name", "child")
+                .containsEntry("count", 3)
+                .containsEntry("enabled", true);
+    }
+
+    @Test
+    void testReadMissingField() {
+        assertThatThrownBy(() -> ReflectionBatch.readFields(new Child(), new String[] {"missing"}))
+                .isInstanceOf(NoSuchFieldException.class)
+                .hasMessageContaining("missing");
+    }
+
+    private static class Parent {
+        private final String name = "child";
+        private final int count = 3;
+    }
+
+    private static class Child extends Parent {
+        private final boolean enabled = true;
+    }
+}